@@ -1,3 +1,6 @@
+from functools import cache
+
+
 class Choices:
     """Helper class to make choices available as class variables.
 
@@ -23,5 +26,6 @@ def get_choices(cls):
         return cls.valid_choices
 
     @classmethod
+    @cache
     def get_max_length(cls):
         return max(len(val) for val, _ in cls.valid_choices)
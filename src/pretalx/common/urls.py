@@ -3,7 +3,7 @@
 
 from django.conf import settings
 from django.urls import resolve, reverse
-from urlman import Urls
+from urlman import Urls, UrlString
 
 
 def get_base_url(event=None, url=None):
@@ -33,3 +33,26 @@ def get_hostname(self, url):
     def get_scheme(self, url):
         url = get_base_url(self.instance.event, url)
         return urlparse(url).scheme
+
+
+class CachedEventUrls(EventUrls):
+    """Like ``EventUrls``, but resolves every URL only once per instance.
+
+    Use this for models whose URLs are rendered many times per request.
+    Resolved URLs are cached per pk, so they follow pk changes (e.g. when an
+    object is copied by setting its pk to ``None`` and saving it), but any
+    other value used in a URL must stay the same for the instance's lifetime.
+    Unsaved instances are not cached.
+    """
+
+    def get_url(self, attr):
+        pk = self.instance.pk
+        if not pk:
+            return super().get_url(attr)
+        cache = self.instance.__dict__.setdefault("_resolved_urls", {})
+        key = (pk, self.__name__, attr)
+        if key not in cache:
+            cache[key] = str(super().get_url(attr))
+        url = UrlString(cache[key])
+        url.parent = self
+        return url
@@ -116,9 +116,13 @@ def answers(self):
         submissions = Submission.objects.filter(
             event=self.event, speakers__in=[self.user]
         )
-        return Answer.objects.filter(
-            models.Q(submission__in=submissions) | models.Q(person=self.user)
-        ).order_by("question__position")
+        return (
+            Answer.objects.filter(
+                models.Q(submission__in=submissions) | models.Q(person=self.user)
+            )
+            .select_related("question")
+            .order_by("question__position")
+        )
 
     @property
     def reviewer_answers(self):
@@ -32,6 +32,7 @@ def get_data(self, **kwargs):
                 person__isnull=False,
             )
             .select_related("question", "person")
+            .prefetch_related("options")
             .order_by("person__name")
         )
         for answer in qs:
@@ -69,11 +70,16 @@ def filename(self):
     def get_data(self, **kwargs):
         field_names = ["code", "title", "question", "answer"]
         data = []
-        qs = Answer.objects.filter(
-            question__target="submission",
-            question__event=self.event,
-            question__active=True,
-        ).order_by("submission__title")
+        qs = (
+            Answer.objects.filter(
+                question__target="submission",
+                question__event=self.event,
+                question__active=True,
+            )
+            .select_related("question", "submission")
+            .prefetch_related("options")
+            .order_by("submission__title")
+        )
         for answer in qs:
             data.append(
                 {
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-14 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event", "0040_alter_event_settingsstore_unique_together"),
+        ("submission", "0082_question_icon"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                fields=["event", "active", "target"],
+                name="submission__event_i_f13dff_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.timezone import now
@@ -11,24 +13,47 @@
 from pretalx.common.models.mixins import OrderedModel, PretalxModel
 from pretalx.common.text.path import path_with_hash
 from pretalx.common.text.phrases import phrases
-from pretalx.common.urls import EventUrls
+from pretalx.common.urls import CachedEventUrls
 from pretalx.event.rules import can_change_event_settings
 from pretalx.person.rules import is_reviewer
 from pretalx.submission.rules import is_cfp_open, orga_can_change_submissions
 
+BOOLEAN_ANSWERS = {"True": True, "False": False}
+
 
 def answer_file_path(instance, filename):
     return path_with_hash(
-        filename, base_path=f"{instance.question.event.slug}/question_uploads/"
+        filename, base_path=f"{instance.event.slug}/question_uploads/"
     )
 
 
+def _get_question_event(instance):
+    """Returns the event of an object with a ``question`` foreign key.
+
+    If the question has not been loaded yet, we fetch the event directly
+    instead of loading the question first and its event second.
+    """
+    if instance._meta.get_field("question").is_cached(instance):
+        return instance.question.event
+    from pretalx.event.models import Event
+
+    return Event.objects.get(questions__pk=instance.question_id)
+
+
+def _get_pks(objects):
+    """Returns something to use in a ``pk__in`` lookup for a queryset or a
+    list of model instances."""
+    if isinstance(objects, models.QuerySet):
+        return objects
+    return [getattr(obj, "pk", obj) for obj in objects]
+
+
 class QuestionManager(models.Manager):
     def get_queryset(self):
         return (
             super()
             .get_queryset()
-            .exclude(active=False)
+            .filter(active=True)
             .exclude(target=QuestionTarget.REVIEWER)
         )
 
@@ -314,6 +339,7 @@ class Question(OrderedModel, PretalxModel):
 
     class Meta:
         ordering = ("position", "id")
+        indexes = [models.Index(fields=["event", "active", "target"])]
         rules_permissions = QUESTION_PERMISSIONS
 
     @property
@@ -324,7 +350,7 @@ def log_parent(self):
     def required(self):
         _now = now()
         # Question should become optional in order to be frozen
-        if self.read_only:
+        if self._is_read_only(_now):
             return False
         if self.question_required == QuestionRequired.REQUIRED:
             return True
@@ -332,9 +358,12 @@ def required(self):
             return self.deadline <= _now
         return False
 
-    @property
+    @cached_property
     def read_only(self):
-        return self.freeze_after and (self.freeze_after <= now())
+        return self._is_read_only(now())
+
+    def _is_read_only(self, _now):
+        return self.freeze_after and (self.freeze_after <= _now)
 
     @cached_property
     def icon_url(self):
@@ -343,7 +372,7 @@ def icon_url(self):
                 "api:question-icon", kwargs={"event": self.event.slug, "pk": self.pk}
             )
 
-    class urls(EventUrls):
+    class urls(CachedEventUrls):
         base = "{self.event.cfp.urls.questions}{self.pk}/"
         edit = "{base}edit/"
         delete = "{base}delete/"
@@ -357,37 +386,38 @@ def get_order_queryset(event):
         return event.questions(manager="all_objects").all()
 
     def missing_answers(
-        self, filter_speakers: list = False, filter_talks: list = False
+        self, filter_speakers: list = None, filter_talks: list = None
     ) -> int:
         """Returns how many answers are still missing or this question.
 
         This method only supports submission questions and speaker questions.
         For missing reviews, please use the get_missing_reviews method.
 
-        :param filter_speakers: Apply only to these speakers.
-        :param filter_talks: Apply only to these talks.
+        :param filter_speakers: Apply only to these speakers. Only used for
+            speaker questions.
+        :param filter_talks: Apply only to these talks of this event. Only used
+            for submission questions.
         """
-        from pretalx.person.models import User
-        from pretalx.submission.models import Submission
-
-        answers = self.answers.all()
-        filter_talks = filter_talks or Submission.objects.none()
-        filter_speakers = filter_speakers or User.objects.none()
-        if filter_speakers or filter_talks:
-            answers = answers.filter(
-                models.Q(person__in=filter_speakers)
-                | models.Q(submission__in=filter_talks)
-            )
-        answer_count = answers.count()
         if self.target == QuestionTarget.SUBMISSION:
-            submissions = filter_talks or self.event.submissions.all()
-            return max(submissions.count() - answer_count, 0)
-        if self.target == QuestionTarget.SPEAKER:
-            users = filter_speakers or User.objects.filter(
-                submissions__event_id=self.event.pk
-            )
-            return max(users.count() - answer_count, 0)
-        return 0
+            objects = self.event.submissions.all()
+            if filter_talks is not None:
+                objects = objects.filter(pk__in=_get_pks(filter_talks))
+        elif self.target == QuestionTarget.SPEAKER:
+            from pretalx.person.models import User
+
+            if filter_speakers is not None:
+                objects = User.objects.filter(pk__in=_get_pks(filter_speakers))
+            else:
+                objects = User.objects.filter(submissions__event_id=self.event.pk)
+        else:
+            return 0
+        counts = objects.aggregate(
+            total=models.Count("pk", distinct=True),
+            answered=models.Count(
+                "pk", distinct=True, filter=models.Q(answers__question=self)
+            ),
+        )
+        return max(counts["total"] - counts["answered"], 0)
 
 
 class AnswerOption(PretalxModel):
@@ -412,7 +442,7 @@ class Meta:
 
     @cached_property
     def event(self):
-        return self.question.event
+        return _get_question_event(self)
 
     @property
     def log_parent(self):
@@ -423,6 +453,38 @@ def __str__(self):
         return str(self.answer)
 
 
+def _text_answer_string(answer):
+    return answer.answer or ""
+
+
+def _boolean_answer_string(answer):
+    if answer.boolean_answer is True:
+        return _("Yes")
+    if answer.boolean_answer is False:
+        return _("No")
+    return ""
+
+
+def _file_answer_string(answer):
+    return answer.answer_file.url if answer.answer_file else ""
+
+
+def _choice_answer_string(answer):
+    return ", ".join(str(option.answer) for option in answer.options.all())
+
+
+ANSWER_STRING_HANDLERS = {
+    QuestionVariant.NUMBER: _text_answer_string,
+    QuestionVariant.STRING: _text_answer_string,
+    QuestionVariant.TEXT: _text_answer_string,
+    QuestionVariant.URL: _text_answer_string,
+    QuestionVariant.BOOLEAN: _boolean_answer_string,
+    QuestionVariant.FILE: _file_answer_string,
+    QuestionVariant.CHOICES: _choice_answer_string,
+    QuestionVariant.MULTIPLE: _choice_answer_string,
+}
+
+
 class Answer(PretalxModel):
     """Answers are connected to a.
 
@@ -483,7 +545,7 @@ class Meta:
 
     @cached_property
     def event(self):
-        return self.question.event
+        return _get_question_event(self)
 
     @property
     def log_parent(self):
@@ -493,37 +555,34 @@ def __str__(self):
         """Help when debugging."""
         return f"Answer(question={self.question.question}, answer={self.answer})"
 
+    def save(self, *args, **kwargs):
+        self.clear_cached_answer()
+        return super().save(*args, **kwargs)
+
+    def clear_cached_answer(self):
+        """Drops the cached answer representations, to be used whenever the
+        answer or its options change."""
+        for attribute in ("boolean_answer", "answer_string", "is_answered"):
+            self.__dict__.pop(attribute, None)
+
     def remove(self, person=None, force=False):
         """Deletes an answer."""
-        for option in self.options.all():
-            option.answers.remove(self)
+        self.options.clear()
         self.delete()
 
     remove.alters_data = True
 
     @cached_property
     def boolean_answer(self):
-        if self.answer == "True":
-            return True
-        if self.answer == "False":
-            return False
+        return BOOLEAN_ANSWERS.get(self.answer)
 
-    @property
+    @cached_property
     def answer_string(self):
-        if self.question.variant in ("number", "string", "text", "url"):
-            return self.answer or ""
-        if self.question.variant == "boolean":
-            if self.boolean_answer is True:
-                return _("Yes")
-            if self.boolean_answer is False:
-                return _("No")
-            return ""
-        if self.question.variant == "file":
-            return self.answer_file.url if self.answer_file else ""
-        if self.question.variant in ("choices", "multiple_choice"):
-            return ", ".join(str(option.answer) for option in self.options.all())
+        handler = ANSWER_STRING_HANDLERS.get(self.question.variant)
+        if handler:
+            return handler(self)
 
-    @property
+    @cached_property
     def is_answered(self):
         return bool(self.answer_string)
 
@@ -536,3 +595,9 @@ def log_action(self, *args, content_object=None, **kwargs):
             elif self.question.target == QuestionTarget.REVIEWER:
                 content_object = self.review
         return super().log_action(*args, content_object=content_object, **kwargs)
+
+
+@receiver(m2m_changed, sender=Answer.options.through)
+def clear_cached_answer_on_options_change(sender, instance, reverse, **kwargs):
+    if not reverse:
+        instance.clear_cached_answer()
@@ -440,8 +440,10 @@ def is_anonymised(self) -> bool:
 
     @cached_property
     def reviewer_answers(self):
-        return self.answers.filter(question__is_visible_to_reviewers=True).order_by(
-            "question__position"
+        return (
+            self.answers.filter(question__is_visible_to_reviewers=True)
+            .select_related("question")
+            .order_by("question__position")
         )
 
     @cached_property
@@ -1052,7 +1054,9 @@ def get_content_for_mail(self):
                 _field = self._meta.get_field(field)
                 field_name = _field.verbose_name or _field.name
                 data.append({"name": field_name, "value": field_content})
-        for answer in self.answers.all().order_by("question__position"):
+        for answer in self.answers.select_related("question").order_by(
+            "question__position"
+        ):
             if answer.question.variant == "boolean":
                 data.append(
                     {"name": answer.question.question, "value": answer.boolean_answer}
@@ -1,7 +1,11 @@
+import datetime as dt
+
 import pytest
-from django_scopes import scope
+from django.utils.timezone import now
+from django_scopes import scope, scopes_disabled
 
-from pretalx.submission.models import Answer, Question
+from pretalx.submission.models import Answer, Question, Submission
+from pretalx.submission.models.question import QuestionRequired, answer_file_path
 
 
 @pytest.mark.parametrize("target", ("submission", "speaker", "reviewer"))
@@ -26,6 +30,94 @@ def test_missing_answers_submission_question(submission, target, question):
         assert question.missing_answers() == 0
 
 
+@pytest.mark.django_db
+def test_missing_answers_speaker_question_counts_speakers_once(
+    submission, other_submission, speaker_question, speaker
+):
+    with scope(event=submission.event):
+        other_submission.speakers.add(speaker)
+        assert speaker_question.missing_answers() == 2
+        Answer.objects.create(answer="blue", person=speaker, question=speaker_question)
+        assert speaker_question.missing_answers() == 1
+
+
+@pytest.mark.django_db
+def test_missing_answers_submission_question_filter_talks(
+    submission, other_submission, question, speaker
+):
+    with scope(event=submission.event):
+        Answer.objects.create(
+            answer="1", submission=submission, person=speaker, question=question
+        )
+        event_submissions = submission.event.submissions.all()
+        assert question.missing_answers() == 1
+        assert question.missing_answers(filter_talks=event_submissions) == 1
+        assert (
+            question.missing_answers(
+                filter_talks=event_submissions.filter(pk=submission.pk)
+            )
+            == 0
+        )
+        assert (
+            question.missing_answers(
+                filter_talks=event_submissions.filter(pk=other_submission.pk)
+            )
+            == 1
+        )
+        assert question.missing_answers(filter_talks=event_submissions.none()) == 0
+        # Speaker filters do not apply to submission questions
+        assert (
+            question.missing_answers(
+                filter_speakers=[speaker],
+                filter_talks=event_submissions.filter(pk=other_submission.pk),
+            )
+            == 1
+        )
+
+
+@pytest.mark.django_db
+def test_missing_answers_submission_question_ignores_other_events(
+    submission, question, other_event
+):
+    with scopes_disabled():
+        other_submission = Submission.objects.create(
+            title="Elsewhere",
+            event=other_event,
+            submission_type=other_event.cfp.default_type,
+        )
+        talks = Submission.objects.filter(pk__in=[submission.pk, other_submission.pk])
+    with scope(event=submission.event):
+        assert question.missing_answers(filter_talks=talks) == 1
+
+
+@pytest.mark.django_db
+def test_missing_answers_speaker_question_filter_speakers(
+    submission, other_submission, speaker_question, speaker, other_speaker
+):
+    with scope(event=submission.event):
+        Answer.objects.create(answer="blue", person=speaker, question=speaker_question)
+        assert speaker_question.missing_answers() == 1
+        assert speaker_question.missing_answers(filter_speakers=[speaker]) == 0
+        assert speaker_question.missing_answers(filter_speakers=[other_speaker]) == 1
+        assert (
+            speaker_question.missing_answers(
+                filter_speakers=submission.event.submitters
+            )
+            == 1
+        )
+        assert speaker_question.missing_answers(filter_speakers=[]) == 0
+        # Talk filters do not apply to speaker questions
+        assert (
+            speaker_question.missing_answers(
+                filter_speakers=[speaker],
+                filter_talks=submission.event.submissions.filter(
+                    pk=other_submission.pk
+                ),
+            )
+            == 0
+        )
+
+
 @pytest.mark.django_db
 def test_question_required_property_optional_questions(question):
     assert question.required is False
@@ -104,6 +196,29 @@ def test_question_property_freeze_after_option_before_deadline(
     assert question_freeze_after_option_before_deadline.read_only is False
 
 
+@pytest.mark.parametrize(
+    "freeze_delta,read_only,required",
+    ((-dt.timedelta(weeks=4), True, False), (dt.timedelta(weeks=4), False, True)),
+)
+@pytest.mark.django_db
+def test_question_read_only_and_required_on_same_instance(
+    event, freeze_delta, read_only, required
+):
+    with scope(event=event):
+        question = Question.objects.create(
+            event=event,
+            question="?",
+            question_required=QuestionRequired.REQUIRED,
+            freeze_after=now() + freeze_delta,
+        )
+        question = Question.objects.get(pk=question.pk)
+        assert question.read_only is read_only
+        assert question.required is required
+        question = Question.objects.get(pk=question.pk)
+        assert question.required is required
+        assert question.read_only is read_only
+
+
 @pytest.mark.django_db
 def test_question_base_properties(submission, question):
     a = Answer.objects.create(answer="True", submission=submission, question=question)
@@ -112,6 +227,20 @@ def test_question_base_properties(submission, question):
     assert str(a.question.question) in str(a)
 
 
+@pytest.mark.django_db
+def test_answer_event_without_loaded_question(
+    submission, question, django_assert_num_queries
+):
+    with scope(event=submission.event):
+        Answer.objects.create(answer="1", submission=submission, question=question)
+        answer = Answer.objects.get(question=question)
+        with django_assert_num_queries(1):
+            assert answer.event == submission.event
+        answer = Answer.objects.select_related("question__event").get(question=question)
+        with django_assert_num_queries(0):
+            assert answer.event == submission.event
+
+
 @pytest.mark.parametrize(
     "variant,answer,expected",
     (
@@ -132,3 +261,112 @@ def test_answer_string_property(event, variant, answer, expected):
         question = Question.objects.create(question="?", variant=variant, event=event)
         answer = Answer.objects.create(question=question, answer=answer)
         assert answer.answer_string == expected
+
+
+@pytest.mark.django_db
+def test_answer_string_uses_prefetched_options(
+    answered_choice_question, django_assert_num_queries
+):
+    with scope(event=answered_choice_question.event):
+        answer = (
+            Answer.objects.select_related("question")
+            .prefetch_related("options")
+            .get(question=answered_choice_question)
+        )
+        with django_assert_num_queries(0):
+            assert answer.answer_string == "very"
+            assert answer.is_answered is True
+
+
+@pytest.mark.django_db
+def test_answer_remove_keeps_options(answered_choice_question):
+    with scope(event=answered_choice_question.event):
+        answer = answered_choice_question.answers.get()
+        answer.remove()
+        assert not answered_choice_question.answers.exists()
+        assert answered_choice_question.options.count() == 3
+
+
+@pytest.mark.django_db
+def test_question_urls_are_resolved_once(question, django_assert_num_queries):
+    with scope(event=question.event):
+        question = Question.objects.get(pk=question.pk)
+        edit_url = question.urls.edit
+        assert edit_url == f"{question.event.cfp.urls.questions}{question.pk}/edit/"
+        with django_assert_num_queries(0):
+            assert question.urls.edit == edit_url
+            assert question.urls.edit.full().endswith(edit_url)
+
+
+@pytest.mark.django_db
+def test_question_urls_follow_pk_change(question):
+    with scope(event=question.event):
+        question = Question.objects.get(pk=question.pk)
+        base_url = question.event.cfp.urls.questions
+        assert question.urls.edit == f"{base_url}{question.pk}/edit/"
+        question.pk += 1000
+        assert question.urls.edit == f"{base_url}{question.pk}/edit/"
+        assert question.urls.toggle == f"{base_url}{question.pk}/toggle/"
+        question.pk = None
+        assert question.urls.edit == f"{base_url}None/edit/"
+        question.save()
+        assert question.urls.edit == f"{base_url}{question.pk}/edit/"
+
+
+@pytest.mark.django_db
+def test_question_urls_before_save(event):
+    question = Question(event=event, question="?")
+    assert question.urls.base == f"{event.cfp.urls.questions}None/"
+
+
+@pytest.mark.django_db
+def test_answer_file_path(submission, question, django_assert_num_queries):
+    with scope(event=submission.event):
+        Answer.objects.create(answer="", submission=submission, question=question)
+        answer = Answer.objects.get(question=question)
+        with django_assert_num_queries(1):
+            path = answer_file_path(answer, "file.pdf")
+        assert path.startswith(f"{submission.event.slug}/question_uploads/file_")
+        assert path.endswith(".pdf")
+
+
+@pytest.mark.django_db
+def test_answer_string_follows_changed_answer(submission, question):
+    with scope(event=submission.event):
+        answer = Answer.objects.create(
+            answer="1", submission=submission, question=question
+        )
+        assert answer.answer_string == "1"
+        assert answer.is_answered is True
+        answer.answer = ""
+        answer.save()
+        assert answer.answer_string == ""
+        assert answer.is_answered is False
+        answer.answer = "2"
+        answer.save()
+        assert answer.answer_string == "2"
+
+
+@pytest.mark.django_db
+def test_boolean_answer_follows_changed_answer(event):
+    with scope(event=event):
+        question = Question.objects.create(question="?", variant="boolean", event=event)
+        answer = Answer.objects.create(question=question, answer="True")
+        assert answer.boolean_answer is True
+        assert answer.answer_string == "Yes"
+        answer.answer = "False"
+        answer.save()
+        assert answer.boolean_answer is False
+        assert answer.answer_string == "No"
+
+
+@pytest.mark.django_db
+def test_answer_string_follows_changed_options(answered_choice_question):
+    with scope(event=answered_choice_question.event):
+        answer = answered_choice_question.answers.get()
+        assert answer.answer_string == "very"
+        answer.options.clear()
+        assert answer.answer_string == ""
+        assert answer.is_answered is False
+        answer.options.add(*answered_choice_question.options.all())
+        assert answer.answer_string == "very, incredibly, omggreen"